@@ -1,65 +1,164 @@
+import collections
+import contextlib
+import functools
+import hashlib
+import io
 import json
 import logging
+import mmap
 import os
+import pickle
+import platform
+import re
 import shutil
+import subprocess
 import sys
+import threading
+from pathlib import Path
+from types import MappingProxyType
 
 # from detectron2.utils.logger import setup_logger
 from loguru import logger
-from magic_pdf.config.enums import SupportedPdfParseMethod
-from magic_pdf.config.make_content_config import DropMode, MakeMode
-from magic_pdf.data.data_reader_writer import (FileBasedDataReader,
-                                               FileBasedDataWriter)
-from magic_pdf.data.dataset import PymuDocDataset
-from magic_pdf.model.doc_analyze_by_custom_model import doc_analyze
-from PyQt6.QtCore import QLocale, QThread, pyqtSignal
+from PyQt6.QtCore import QLocale, QThread, QTimer, pyqtSignal
+from PyQt6.QtGui import QTextCursor
 from PyQt6.QtWidgets import (QApplication, QCheckBox, QComboBox, QFileDialog,
                              QHBoxLayout, QLabel, QLineEdit, QMainWindow,
                              QMessageBox, QPlainTextEdit, QProgressBar,
                              QPushButton, QSpinBox, QVBoxLayout, QWidget)
 
+try:
+    import orjson
+except ImportError:  # optional, faster JSON parser
+    orjson = None
+
+# magic_pdf pulls in torch and the model stack, so it is imported by the
+# first CommandRunner that needs it rather than at GUI startup
+SupportedPdfParseMethod = None
+FileBasedDataWriter = None
+PymuDocDataset = None
+InferenceResult = None
+read_config = None
+magic_pdf_version = None
+doc_analyze = None
+_pipeline_lock = threading.Lock()
+# magic_pdf loads its models into unlocked singletons and calls them without
+# synchronization, and PyMuPDF is not thread-safe, so runners share the
+# models and PyMuPDF documents one at a time
+_model_lock = threading.Lock()
+
+
+def _import_pipeline():
+    global SupportedPdfParseMethod, FileBasedDataWriter, PymuDocDataset
+    global InferenceResult, read_config, magic_pdf_version, doc_analyze
+    if doc_analyze is not None:
+        return
+    # The prewarm thread and the first runner may get here together
+    with _pipeline_lock:
+        if doc_analyze is not None:
+            return
+        from magic_pdf.config.enums import SupportedPdfParseMethod
+        from magic_pdf.data.data_reader_writer import FileBasedDataWriter
+        from magic_pdf.data.dataset import PymuDocDataset
+        from magic_pdf.libs.config_reader import read_config
+        from magic_pdf.libs.version import __version__ as magic_pdf_version
+        from magic_pdf.operators.models import InferenceResult
 
-class TranslationManager:
-    _instance = None
+        # Bound last: the unlocked check above relies on it
+        from magic_pdf.model.doc_analyze_by_custom_model import doc_analyze
+
+
+_prewarm_thread = None
+
+
+def _prewarm_pipeline():
+    """Import magic_pdf in the background so the first run starts sooner"""
+    global _prewarm_thread
+    if _prewarm_thread is not None:
+        return
+
+    def prewarm():
+        try:
+            _import_pipeline()
+        except Exception:
+            pass  # Reported by the CommandRunner that needs it
+
+    # Not a daemon: main() joins it so exiting never cuts an import short
+    _prewarm_thread = threading.Thread(target=prewarm, name="magic_pdf-prewarm")
+    _prewarm_thread.start()
 
-    def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-            cls._instance._initialize()
-        return cls._instance
 
-    def _initialize(self):
-        self.translations = {}
+# Host probes that cannot change while the program runs
+_IS_WINDOWS = platform.system() == "Windows"
+_SYS_LANG = QLocale.system().name()
+
+
+@functools.cache
+def _load_translations():
+    """Parse translations.json once per process and share it read-only"""
+    try:
+        data = Path(__file__).with_name("translations.json").read_bytes()
+        loads = orjson.loads if orjson is not None else json.loads
+        return MappingProxyType(loads(data))
+    except Exception as e:
+        logger.error("Error loading translations: {}", e)
+        return MappingProxyType({})
+
+
+class TranslationManager:
+    __slots__ = (
+        "translations",
+        "current_language",
+        "_by_lang",
+        "_active",
+    )
+
+    def __init__(self):
         self.current_language = "en"  # Default to English
+        self._by_lang = {}
         self._load_translations()
+        self._active = self._flat_for(self.current_language)
 
     def _load_translations(self):
-        try:
-            script_dir = os.path.dirname(os.path.abspath(__file__))
-            translation_file = os.path.join(script_dir, "translations.json")
-            with open(translation_file, "r", encoding="utf-8") as f:
-                self.translations = json.load(f)
-        except Exception as e:
-            print(f"Error loading translations: {e}")
-            self.translations = {}
+        self.translations = _load_translations()
+
+    def _flat_for(self, lang):
+        """Return the (category, key) -> text table for one language"""
+        flat = self._by_lang.get(lang)
+        if flat is not None:
+            return flat
+        flat = self._by_lang[lang] = {}
+        for category, keys in self.translations.items():
+            category = sys.intern(category)
+            for key, langs in keys.items():
+                text = langs.get(lang)
+                if text is None:
+                    continue
+                flat[(category, sys.intern(key))] = text
+        return flat
 
     def set_language(self, lang):
         if lang in ["en", "zh"]:
+            self._active = self._flat_for(lang)
             self.current_language = lang
 
     def get_text(self, category, key, **kwargs):
+        text = self._active.get((category, key))
+        if text is None:
+            # Cache the miss so repeated lookups stay O(1)
+            text = self._active[(category, key)] = f"{category}.{key}"
+        # Texts without placeholders never need formatting
+        if not kwargs or "{" not in text:
+            return text
         try:
-            text = (
-                self.translations.get(category, {})
-                .get(key, {})
-                .get(self.current_language, f"{category}.{key}")
-            )
-            return text.format(**kwargs) if kwargs else text
+            return text.format_map(kwargs)
         except Exception as e:
-            print(f"Translation error for {category}.{key}: {e}")
+            logger.debug("Translation error for {}.{}: {}", category, key, e)
             return f"{category}.{key}"
 
 
+_TM = TranslationManager()
+
+
 class SignalHandler(logging.Handler):
     """Custom handler to forward standard logging messages to Qt signal"""
 
@@ -69,15 +168,108 @@ class SignalHandler(logging.Handler):
 
     def emit(self, record):
         try:
-            msg = self.format(record)
+            # Only the message is shown; tracebacks still need the formatter
+            if record.exc_info or record.stack_info:
+                msg = self.format(record)
+            else:
+                msg = record.getMessage()
             self.signal_callback(msg)
         except Exception:
             self.handleError(record)
 
 
+class LineBufferedSink(io.TextIOBase):
+    """Stand-in for sys.stdout that forwards complete lines to a callback"""
+
+    # An unterminated line longer than this is forwarded as it is
+    MAX_PENDING = 64 * 1024
+
+    def __init__(self, callback, stream):
+        super().__init__()
+        self.callback = callback
+        self.stream = stream
+        self._pending = ""
+        self._lock = threading.Lock()
+
+    @property
+    def encoding(self):
+        return "utf-8"
+
+    def writable(self):
+        return True
+
+    def fileno(self):
+        # Code that writes to the descriptor directly gets the real stdout
+        if self.stream is None:
+            raise io.UnsupportedOperation("fileno")
+        return self.stream.fileno()
+
+    def write(self, text):
+        with self._lock:
+            pending = self._pending + text
+            lines = []
+            if "\n" in text:
+                *lines, pending = pending.split("\n")
+                # A progress bar redraws with "\r"; keep what was drawn last
+                lines = [line.rstrip("\r").rsplit("\r", 1)[-1] for line in lines]
+            cut = pending.rfind("\r", 0, len(pending) - 1)
+            if cut >= 0:
+                pending = pending[cut + 1 :]
+            if len(pending) > self.MAX_PENDING:
+                lines.append(pending)
+                pending = ""
+            self._pending = pending
+        for line in lines:
+            self.callback(line)
+        return len(text)
+
+    def take_pending(self):
+        """Return the unterminated tail, if any"""
+        with self._lock:
+            text, self._pending = self._pending.rstrip("\r"), ""
+        return text
+
+
+# Log lines are collected for this long before the GUI appends them
+PROGRESS_BATCH_INTERVAL_MS = 50
+
+# doc_analyze progress lines: magic_pdf 1.0 logs each finished page, later
+# releases log each batch as it starts with the pages done once it is through
+PAGE_LOG_RE = re.compile(r"-----page_id : (\d+),")
+BATCH_LOG_RE = re.compile(r"Batch \d+/\d+: (\d+) pages/(\d+) pages")
+
+# Model output of earlier runs, keyed by PDF content and inference options
+INFERENCE_CACHE_DIR = Path.home() / ".cache" / "mineru-qt"
+# Least recently used entries are removed beyond this total size
+INFERENCE_CACHE_MAX_BYTES = 512 * 1024 * 1024
+# Set to a non-empty value to start with the cache turned off
+INFERENCE_CACHE_ENV_OFF = "MINERU_QT_NO_CACHE"
+
+
 class CommandRunner(QThread):
-    finished = pyqtSignal(bool, str)
-    progress = pyqtSignal(str)
+    # success, message, Markdown content (str or list of str) or None
+    finished = pyqtSignal(bool, str, object)
+    progress_pending = pyqtSignal()
+    # pages analyzed, pages to analyze
+    page_progress = pyqtSignal(int, int)
+
+    # Log interception is process-wide, so concurrent runners share one
+    # loguru sink and logging handler instead of each receiving every line
+    _log_lock = threading.Lock()
+    # Serializes adding and removing the sink and handler; never taken while
+    # dispatching, so it can be held across loguru's and logging's own locks
+    _intercept_lock = threading.Lock()
+    _log_runners = []
+    _logger_id = None
+    _log_handler = None
+    _original_log_level = None
+    _stdout_users = 0
+    # Thread ident -> runner, so each runner gets the lines its thread logs
+    _thread_runners = {}
+    # Runner holding _model_lock; the model stack's worker threads log for it
+    _model_owner = None
+    _stdout_sink = None
+    _original_stdout = None
 
     def __init__(
         self,
@@ -88,6 +280,8 @@ class CommandRunner(QThread):
         start_page,
         end_page,
         debug,
+        use_cache=True,
+        tm=_TM,
     ):
         super().__init__()
         self.pdf_path = pdf_path
@@ -97,25 +291,41 @@ class CommandRunner(QThread):
         self.start_page = start_page
         self.end_page = end_page
         self.debug = debug
-        self.tm = TranslationManager()
-        self.logger_id = None
-        self.log_handler = None
+        self.use_cache = use_cache
+        self.tm = tm
+        self._t = tm.get_text
         self.detectron_logger = None
-        self.original_log_level = None
+        self._progress_buffer = collections.deque()
+        self._progress_lock = threading.Lock()
+        self._progress_notified = False
+        self._page_total = 0
+        self._pages_queued = 0
         self._setup_logging_intercept()
 
     def _setup_logging_intercept(self):
-        # Loguru sink
-        self.logger_id = logger.add(self._log_sink, level="INFO")
-
-        # Standard logging handler
-        self.log_handler = SignalHandler(self._log_sink)
-        self.log_handler.setFormatter(logging.Formatter("%(message)s"))
-        self.log_handler.setLevel(logging.INFO)
-        root_logger = logging.getLogger()
-        self.original_log_level = root_logger.getEffectiveLevel()
-        root_logger.addHandler(self.log_handler)
-        root_logger.setLevel(logging.INFO)
+        cls = CommandRunner
+        with cls._intercept_lock:
+            with cls._log_lock:
+                cls._log_runners.append(self)
+                if len(cls._log_runners) > 1:
+                    return
+
+            # Third-party stdlib logging is only forwarded in debug mode, so
+            # chatty libraries drop records at the logger instead of in the GUI
+            log_level = logging.DEBUG if self.debug else logging.WARNING
+
+            # Loguru sink
+            cls._logger_id = logger.add(
+                cls._dispatch_log, level="DEBUG" if self.debug else "INFO"
+            )
+
+            # Standard logging handler
+            cls._log_handler = SignalHandler(cls._dispatch_log)
+            cls._log_handler.setLevel(log_level)
+            root_logger = logging.getLogger()
+            cls._original_log_level = root_logger.getEffectiveLevel()
+            root_logger.addHandler(cls._log_handler)
+            root_logger.setLevel(log_level)
 
         # Detectron2 logger setup
         # self.detectron_logger = setup_logger(
@@ -126,32 +336,123 @@ class CommandRunner(QThread):
         # )
         # self.detectron_logger.addHandler(self.log_handler)
 
+    @classmethod
+    def _dispatch_log(cls, message):
+        """Route an intercepted log message to the runner it belongs to"""
+        # Lines from threads of the model stack go to the runner holding
+        # _model_lock; anything else belongs to no runner and is dropped
+        with cls._log_lock:
+            runner = cls._thread_runners.get(threading.get_ident())
+            if runner is None:
+                runner = cls._model_owner
+        if runner is not None:
+            runner._log_sink(message)
+
     def _log_sink(self, message):
         """Common sink for both loguru and standard logging"""
-        if hasattr(message, "record"):
-            self.progress.emit(message.record["message"])
+        record = getattr(message, "record", None)
+        if record is not None:
+            text = record["message"]
+            if self._page_total:
+                self._page_logged(text)
+            self._emit_progress(text)
         else:
-            self.progress.emit(str(message))
+            # SignalHandler has already formatted the record to a str
+            self._emit_progress(message)
+
+    def _page_logged(self, text):
+        match = PAGE_LOG_RE.match(text)
+        if match:
+            done = int(match[1]) - self.start_page + 1
+            self.page_progress.emit(done, self._page_total)
+            return
+        match = BATCH_LOG_RE.match(text)
+        if match:
+            # Logged as a batch starts: the previous batches are done
+            done, self._pages_queued = self._pages_queued, int(match[1])
+            self.page_progress.emit(done, int(match[2]))
+
+    def _emit_progress(self, message):
+        """Buffer a progress line, notifying the GUI once per batch"""
+        with self._progress_lock:
+            self._progress_buffer.append(message)
+            if self._progress_notified:
+                return
+            self._progress_notified = True
+        self.progress_pending.emit()
+
+    def take_progress(self):
+        """Drain buffered progress lines into one newline-joined string"""
+        with self._progress_lock:
+            batch = "\n".join(self._progress_buffer)
+            self._progress_buffer.clear()
+            self._progress_notified = False
+        return batch
 
     def _cleanup_logging(self):
-        """Clean up all logging handlers"""
+        """Clean up all logging handlers once the last runner is done"""
+        cls = CommandRunner
         try:
-            if self.logger_id is not None:
-                logger.remove(self.logger_id)
-
-            if self.log_handler:
-                root_logger = logging.getLogger()
-                root_logger.removeHandler(self.log_handler)
-                root_logger.setLevel(self.original_log_level)
-
-            if self.detectron_logger and self.log_handler:
-                self.detectron_logger.removeHandler(self.log_handler)
+            with cls._intercept_lock:
+                # Detach under _log_lock but remove outside it: loguru and
+                # logging take their own locks and may be in _dispatch_log
+                with cls._log_lock:
+                    if cls._thread_runners.get(threading.get_ident()) is self:
+                        del cls._thread_runners[threading.get_ident()]
+                    if self in cls._log_runners:
+                        cls._log_runners.remove(self)
+                    if cls._log_runners:
+                        return
+                    logger_id, cls._logger_id = cls._logger_id, None
+                    handler, cls._log_handler = cls._log_handler, None
+
+                if logger_id is not None:
+                    logger.remove(logger_id)
+
+                if handler:
+                    root_logger = logging.getLogger()
+                    root_logger.removeHandler(handler)
+                    root_logger.setLevel(cls._original_log_level)
+
+                if self.detectron_logger and handler:
+                    self.detectron_logger.removeHandler(handler)
         except Exception as e:
-            print(f"Error cleaning up logging: {e}")
+            logger.warning("Error cleaning up logging: {}", e)
+
+    @classmethod
+    @contextlib.contextmanager
+    def _capture_stdout(cls):
+        """Forward print() output to the log while the models run"""
+        # sys.stdout is process-wide: concurrent runners share one sink and
+        # the last one out restores the original stream
+        with cls._log_lock:
+            if not cls._stdout_users:
+                cls._original_stdout = sys.stdout
+                cls._stdout_sink = LineBufferedSink(cls._dispatch_log, sys.stdout)
+                sys.stdout = cls._stdout_sink
+            cls._stdout_users += 1
+        try:
+            yield
+        finally:
+            tail = ""
+            with cls._log_lock:
+                cls._stdout_users -= 1
+                if not cls._stdout_users:
+                    if sys.stdout is cls._stdout_sink:
+                        sys.stdout = cls._original_stdout
+                    tail = cls._stdout_sink.take_pending()
+                    cls._stdout_sink = cls._original_stdout = None
+            if tail:
+                cls._dispatch_log(tail)
 
     def run(self):
-        self.progress.emit(self.tm.get_text("process_messages", "start_process"))
+        with CommandRunner._log_lock:
+            CommandRunner._thread_runners[threading.get_ident()] = self
+        self._emit_progress(self._t("process_messages", "start_process"))
+        pdf_mm = pdf_view = None
         try:
+            _import_pipeline()
+
             pdf_file_name = os.path.basename(self.pdf_path)
             pdf_name_no_ext = os.path.splitext(pdf_file_name)[0]
 
@@ -159,73 +460,164 @@ class CommandRunner(QThread):
             os.makedirs(local_md_dir, exist_ok=True)
 
             md_writer = FileBasedDataWriter(local_md_dir)
-            reader = FileBasedDataReader("")
 
             output_image_path = os.path.join(local_md_dir, "images")
             os.makedirs(output_image_path, exist_ok=True)
             image_writer = FileBasedDataWriter(output_image_path)
 
-            self.progress.emit(self.tm.get_text("process_messages", "reading_pdf"))
-            pdf_bytes = reader.read(self.pdf_path)
-
-            dataset = PymuDocDataset(pdf_bytes)
-            print(dataset, type(dataset))
-
+            self._emit_progress(self._t("process_messages", "reading_pdf"))
+            # Map the PDF instead of copying it into a bytes object
+            with open(self.pdf_path, "rb") as f:
+                pdf_mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            # PyMuPDF rejects a bare mmap but reads a memoryview of it in place
+            pdf_view = memoryview(pdf_mm)
             self.end_page = None if self.end_page == 0 else self.end_page
-
-            infer_result, pipe_result = self._inference(dataset, image_writer)
-
-            ### draw model result on each page
-            infer_result.draw_model(os.path.join(local_md_dir, f"{pdf_name_no_ext}_model.pdf"))
-
-            ### get model inference result
-            model_inference_result = infer_result.get_infer_res()
-
-            ### draw layout result on each page
-            pipe_result.draw_layout(os.path.join(local_md_dir, f"{pdf_name_no_ext}_layout.pdf"))
-
-            ### draw spans result on each page
-            pipe_result.draw_span(os.path.join(local_md_dir, f"{pdf_name_no_ext}_spans.pdf"))
-
-            ### get markdown content
-            md_content = pipe_result.get_markdown(output_image_path)
+            cache_path = self._cache_path(pdf_view) if self.use_cache else None
+
+            # Concurrent runners take turns from here to the JSON results; only
+            # reading the PDF and writing the Markdown overlap
+            with _model_lock:
+                CommandRunner._model_owner = self
+                try:
+                    md_content = self._run_models(
+                        pdf_view,
+                        image_writer,
+                        md_writer,
+                        cache_path,
+                        local_md_dir,
+                        pdf_name_no_ext,
+                    )
+                finally:
+                    CommandRunner._model_owner = None
+            if cache_path is not None:
+                self._prune_inference_cache()
 
             ### dump markdown
-            pipe_result.dump_md(md_writer, f"{local_md_dir}.md", output_image_path)
-
-            ### get content list content
-            content_list_content = pipe_result.get_content_list(output_image_path)
-
-            ### dump content list
-            pipe_result.dump_content_list(
-                md_writer, f"{pdf_name_no_ext}_content_list.json", output_image_path
-            )
-
-            ### get middle json
-            middle_json_content = pipe_result.get_middle_json()
-
-            ### dump middle json
-            pipe_result.dump_middle_json(md_writer, f"{pdf_name_no_ext}_middle.json")
+            self._write_markdown(local_md_dir, pdf_name_no_ext, md_content)
 
             self.finished.emit(
-                True, self.tm.get_text("process_messages", "process_success")
+                True, self._t("process_messages", "process_success"), md_content
             )
 
         except Exception as e:
-            self.progress.emit(
-                f"{self.tm.get_text('process_messages', 'stderr_prefix')}{str(e)}"
+            self._emit_progress(
+                f"{self._t('process_messages', 'stderr_prefix')}{str(e)}"
             )
             self.finished.emit(
-                False, self.tm.get_text("messages", "process_error", msg=str(e))
+                False, self._t("messages", "process_error", msg=str(e)), None
             )
         finally:
             self._cleanup_logging()
+            # The dataset went away with _run_models, so nothing exports the
+            # view any more and the map can be closed
+            if pdf_view is not None:
+                pdf_view.release()
+            if pdf_mm is not None:
+                pdf_mm.close()
+
+    def _run_models(
+        self,
+        pdf_view,
+        image_writer,
+        md_writer,
+        cache_path,
+        local_md_dir,
+        pdf_name_no_ext,
+    ):
+        """Run the models and dump their results, returning the Markdown"""
+        # The dataset and everything holding it are locals, so the PyMuPDF
+        # document is released before another runner opens its PDF
+        try:
+            dataset = PymuDocDataset(pdf_view)
+        except TypeError:
+            # Older PyMuPDF releases only take bytes
+            dataset = PymuDocDataset(pdf_view.tobytes())
+
+        # Both page bounds are inclusive
+        last_page = len(dataset) - 1
+        if self.end_page is not None:
+            last_page = min(self.end_page, last_page)
+        # The bar stays busy until doc_analyze reports its first page
+        self._page_total = max(last_page - self.start_page + 1, 0)
+
+        infer_result, pipe_result = self._inference(dataset, image_writer, cache_path)
+        self.page_progress.emit(self._page_total, self._page_total)
+
+        ### draw model result on each page
+        infer_result.draw_model(
+            os.path.join(local_md_dir, f"{pdf_name_no_ext}_model.pdf")
+        )
+
+        ### draw layout result on each page
+        pipe_result.draw_layout(
+            os.path.join(local_md_dir, f"{pdf_name_no_ext}_layout.pdf")
+        )
 
-    def _inference(self, dataset, image_writer):
-        use_ocr = (
-            self.method == "ocr" or dataset.classify() == SupportedPdfParseMethod.OCR
+        ### draw spans result on each page
+        pipe_result.draw_span(
+            os.path.join(local_md_dir, f"{pdf_name_no_ext}_spans.pdf")
         )
-        infer_result = dataset.apply(doc_analyze, ocr=use_ocr)
+
+        ### dump content list
+        output_image_path = os.path.join(local_md_dir, "images")
+        pipe_result.dump_content_list(
+            md_writer, f"{pdf_name_no_ext}_content_list.json", output_image_path
+        )
+
+        ### dump middle json
+        pipe_result.dump_middle_json(md_writer, f"{pdf_name_no_ext}_middle.json")
+
+        ### get markdown content
+        return pipe_result.get_markdown(output_image_path)
+
+    def _cache_path(self, pdf_data):
+        # Model output also depends on the magic_pdf release and on the model
+        # settings in magic-pdf.json (layout model, formula/table, device)
+        try:
+            config = json.dumps(read_config(), sort_keys=True, default=str)
+        except Exception:
+            config = ""
+        digest = hashlib.blake2b(pdf_data, digest_size=20)
+        digest.update(
+            f"|{self.method}|{self.lang}|{self.start_page}|{self.end_page}"
+            f"|{magic_pdf_version}|{config}".encode()
+        )
+        return INFERENCE_CACHE_DIR / f"{digest.hexdigest()}.pkl"
+
+    def _inference(self, dataset, image_writer, cache_path):
+        infer_result = None
+        if cache_path is not None:
+            try:
+                with open(cache_path, "rb") as f:
+                    use_ocr, model_list = pickle.load(f)
+                infer_result = InferenceResult(model_list, dataset)
+                os.utime(cache_path)  # Mark as recently used
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                logger.warning(
+                    "Ignoring unreadable inference cache {}: {}", cache_path, e
+                )
+
+        if infer_result is None:
+            # txt is born-digital by definition; only auto needs to classify
+            if self.method == "auto":
+                use_ocr = dataset.classify() == SupportedPdfParseMethod.OCR
+            else:
+                use_ocr = self.method == "ocr"
+            # Run the models on the selected pages only
+            with self._capture_stdout():
+                infer_result = dataset.apply(
+                    doc_analyze,
+                    ocr=use_ocr,
+                    start_page_id=self.start_page,
+                    end_page_id=self.end_page,
+                )
+            if cache_path is not None:
+                self._store_inference(
+                    cache_path, use_ocr, infer_result.get_infer_res()
+                )
+
         if use_ocr:
             pipe_result = infer_result.pipe_ocr_mode(
                 image_writer,
@@ -240,29 +632,152 @@ class CommandRunner(QThread):
             )
         return infer_result, pipe_result
 
-    def _write_markdown(self, md_writer, pdf_name_no_ext, md_content):
-        md_filename = f"{pdf_name_no_ext}.md"
-        md_content_str = (
-            "\n".join(md_content) if isinstance(md_content, list) else md_content
-        )
-        md_writer.write_string(md_filename, md_content_str)
+    def _store_inference(self, cache_path, use_ocr, model_list):
+        # Write next to the target and rename so readers never see a partial file
+        tmp_path = cache_path.with_suffix(f".{os.getpid()}.{threading.get_ident()}")
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "wb") as f:
+                pickle.dump((use_ocr, model_list), f, protocol=5)
+            os.replace(tmp_path, cache_path)
+        except Exception as e:
+            # The cache is best-effort; never fail a finished conversion
+            logger.warning("Could not write inference cache {}: {}", cache_path, e)
+            with contextlib.suppress(OSError):
+                tmp_path.unlink(missing_ok=True)
+
+    def _prune_inference_cache(self):
+        """Remove least recently used entries beyond INFERENCE_CACHE_MAX_BYTES"""
+        try:
+            entries = []
+            with os.scandir(INFERENCE_CACHE_DIR) as it:
+                for entry in it:
+                    if entry.name.endswith(".pkl"):
+                        st = entry.stat()
+                        entries.append((st.st_mtime, st.st_size, entry.path))
+            total = sum(size for _, size, _ in entries)
+            for _, size, path in sorted(entries):
+                if total <= INFERENCE_CACHE_MAX_BYTES:
+                    break
+                # Another runner may have pruned it already
+                with contextlib.suppress(FileNotFoundError):
+                    os.remove(path)
+                total -= size
+        except OSError as e:
+            logger.warning("Could not prune inference cache: {}", e)
+
+    def _write_markdown(self, local_md_dir, pdf_name_no_ext, md_content):
+        md_path = os.path.join(local_md_dir, f"{pdf_name_no_ext}.md")
+        # Write list parts one by one rather than joining a second full copy
+        with open(md_path, "w", encoding="utf-8", buffering=1 << 20) as out:
+            if isinstance(md_content, list):
+                for i, part in enumerate(md_content):
+                    if i:
+                        out.write("\n")
+                    out.write(part)
+            else:
+                out.write(md_content)
+
+
+class CleanupRunner(QThread):
+    finished = pyqtSignal(bool, str)
+
+    def __init__(self, paths):
+        super().__init__()
+        self.paths = paths
+
+    def run(self):
+        try:
+            if _IS_WINDOWS:
+                for path in self.paths:
+                    shutil.rmtree(path)
+            else:
+                # A single coreutils rm is far faster than a Python-level walk
+                result = subprocess.run(
+                    ["rm", "-rf", "--", *self.paths], capture_output=True
+                )
+                if result.returncode != 0:
+                    raise OSError(result.stderr.decode(errors="replace").strip())
+            self.finished.emit(True, "")
+        except Exception as e:
+            self.finished.emit(False, str(e))
+
+
+# Joins several selected PDFs in the input field, which is split on ";"
+PDF_PATH_SEPARATOR = "; "
+
+
+# Only the head of very large Markdown outputs is shown in the preview
+PREVIEW_MAX_CHARS = 2 * 1024 * 1024
+# The preview is streamed in slices so the event loop keeps running
+PREVIEW_CHUNK_CHARS = 64 * 1024
+
+
+class MarkdownLoader(QThread):
+    chunk = pyqtSignal(str)
+    loaded = pyqtSignal(bool)
+    failed = pyqtSignal(str)
+
+    def __init__(self, md_content):
+        super().__init__()
+        self.md_content = md_content
+
+    def run(self):
+        try:
+            # Take the head of the content the runner already has in memory,
+            # joined like _write_markdown does
+            parts = self.md_content
+            if isinstance(parts, str):
+                parts = [parts]
+            head = []
+            remaining = PREVIEW_MAX_CHARS
+            truncated = False
+            for i, part in enumerate(parts):
+                if i:
+                    part = "\n" + part
+                if len(part) > remaining:
+                    head.append(part[:remaining])
+                    truncated = True
+                    break
+                head.append(part)
+                remaining -= len(part)
+            text = "".join(head)
+
+            # Hand over whole lines where possible
+            pos = 0
+            while pos < len(text):
+                end = pos + PREVIEW_CHUNK_CHARS
+                if end < len(text):
+                    end = text.rfind("\n", pos, end) + 1 or end
+                self.chunk.emit(text[pos:end])
+                pos = end
+            self.loaded.emit(truncated)
+        except Exception as e:
+            self.failed.emit(str(e))
 
 
 class MinerUGUI(QMainWindow):
-    def __init__(self):
+    def __init__(self, tm=_TM):
         super().__init__()
         self.conda_env = "MinerU"
         self.cancel_requested = False
-        self.tm = TranslationManager()
+        self.tm = tm
+        self._runners = {}
+        self._pending = collections.deque()
+        self._run_options = ()
+        self._batch_total = 0
+        self._batch_done = 0
+        self._batch_error = None
+        self._last_md_content = None
 
         # Set language based on system locale
-        system_lang = QLocale.system().name()
-        self.tm.set_language("zh" if system_lang.startswith("zh") else "en")
+        self.tm.set_language("zh" if _SYS_LANG.startswith("zh") else "en")
 
         self.init_ui()
 
     def init_ui(self):
-        self.setWindowTitle(self.tm.get_text("window", "title"))
+        _t = self.tm.get_text
+        self.setWindowTitle(_t("window", "title"))
 
         self.setGeometry(100, 100, 800, 600)
 
@@ -277,9 +792,11 @@ class MinerUGUI(QMainWindow):
         # Input file/directory selection
         input_layout = QHBoxLayout()
         self.input_path = QLineEdit()
-        input_btn = QPushButton(self.tm.get_text("buttons", "select_pdf"))
+        self._pdf_inputs = []
+        self.input_path.textChanged.connect(self._update_pdf_inputs)
+        input_btn = QPushButton(_t("buttons", "select_pdf"))
         input_btn.clicked.connect(self.select_pdf)
-        input_layout.addWidget(QLabel(self.tm.get_text("labels", "input_path")))
+        input_layout.addWidget(QLabel(_t("labels", "input_path")))
         input_layout.addWidget(self.input_path)
         input_layout.addWidget(input_btn)
         left_layout.addLayout(input_layout)
@@ -287,9 +804,9 @@ class MinerUGUI(QMainWindow):
         # Output directory selection
         output_layout = QHBoxLayout()
         self.output_path = QLineEdit()
-        output_btn = QPushButton(self.tm.get_text("buttons", "select_output"))
+        output_btn = QPushButton(_t("buttons", "select_output"))
         output_btn.clicked.connect(self.select_output)
-        output_layout.addWidget(QLabel(self.tm.get_text("labels", "output_dir")))
+        output_layout.addWidget(QLabel(_t("labels", "output_dir")))
         output_layout.addWidget(self.output_path)
         output_layout.addWidget(output_btn)
         left_layout.addLayout(output_layout)
@@ -298,17 +815,15 @@ class MinerUGUI(QMainWindow):
         method_layout = QHBoxLayout()
         self.method_combo = QComboBox()
         self.method_combo.addItems(["auto", "ocr", "txt"])
-        method_layout.addWidget(QLabel(self.tm.get_text("labels", "method")))
+        method_layout.addWidget(QLabel(_t("labels", "method")))
         method_layout.addWidget(self.method_combo)
         left_layout.addLayout(method_layout)
 
         # Language selection
         lang_layout = QHBoxLayout()
         self.lang_input = QLineEdit()
-        self.lang_input.setPlaceholderText(
-            self.tm.get_text("placeholders", "language_input")
-        )
-        lang_layout.addWidget(QLabel(self.tm.get_text("labels", "language")))
+        self.lang_input.setPlaceholderText(_t("placeholders", "language_input"))
+        lang_layout.addWidget(QLabel(_t("labels", "language")))
         lang_layout.addWidget(self.lang_input)
         left_layout.addLayout(lang_layout)
 
@@ -318,24 +833,47 @@ class MinerUGUI(QMainWindow):
         self.end_page = QSpinBox()
         self.start_page.setMinimum(0)
         self.end_page.setMinimum(0)
-        page_layout.addWidget(QLabel(self.tm.get_text("labels", "start_page")))
+        page_layout.addWidget(QLabel(_t("labels", "start_page")))
         page_layout.addWidget(self.start_page)
-        page_layout.addWidget(QLabel(self.tm.get_text("labels", "end_page")))
+        page_layout.addWidget(QLabel(_t("labels", "end_page")))
         page_layout.addWidget(self.end_page)
         left_layout.addLayout(page_layout)
 
         # Debug mode
         debug_layout = QHBoxLayout()
-        self.debug_check = QCheckBox(self.tm.get_text("labels", "debug_mode"))
+        self.debug_check = QCheckBox(_t("labels", "debug_mode"))
         debug_layout.addWidget(self.debug_check)
+        self.cache_check = QCheckBox(_t("labels", "use_cache"))
+        self.cache_check.setChecked(not os.environ.get(INFERENCE_CACHE_ENV_OFF))
+        self.cache_check.setToolTip(
+            _t(
+                "tooltips",
+                "use_cache",
+                path=INFERENCE_CACHE_DIR,
+                size=INFERENCE_CACHE_MAX_BYTES // (1024 * 1024),
+            )
+        )
+        debug_layout.addWidget(self.cache_check)
         left_layout.addLayout(debug_layout)
 
+        # Number of documents converted at the same time
+        concurrency_layout = QHBoxLayout()
+        self.concurrency_spin = QSpinBox()
+        # The models run one document at a time (_model_lock), so a second
+        # slot only overlaps its file I/O with the other's inference
+        self.concurrency_spin.setRange(1, 2)
+        self.concurrency_spin.setValue(1)
+        self.concurrency_spin.setToolTip(_t("tooltips", "concurrency"))
+        concurrency_layout.addWidget(QLabel(_t("labels", "concurrency")))
+        concurrency_layout.addWidget(self.concurrency_spin)
+        left_layout.addLayout(concurrency_layout)
+
         # Progress bar and status
         self.progress_bar = QProgressBar()
         self.progress_bar.setTextVisible(False)
         left_layout.addWidget(self.progress_bar)
 
-        self.status_label = QLabel(self.tm.get_text("status", "ready"))
+        self.status_label = QLabel(_t("status", "ready"))
         status_label_font = self.status_label.font()
         status_label_font.setBold(True)
         self.status_label.setFont(status_label_font)
@@ -345,13 +883,16 @@ class MinerUGUI(QMainWindow):
         self.output_log = QPlainTextEdit()
         self.output_log.setReadOnly(True)
         self.output_log.setLineWrapMode(QPlainTextEdit.LineWrapMode.WidgetWidth)
+        # Cap scrollback so appends stay cheap on long, verbose runs
+        self.output_log.setMaximumBlockCount(5000)
+        self.output_log.setUndoRedoEnabled(False)
         left_layout.addWidget(self.output_log)
 
         # Process and Cancel Buttons
         btn_layout = QHBoxLayout()
-        self.process_btn = QPushButton(self.tm.get_text("buttons", "process_pdf"))
+        self.process_btn = QPushButton(_t("buttons", "process_pdf"))
         self.process_btn.clicked.connect(self.process_pdf)
-        self.cancel_btn = QPushButton(self.tm.get_text("buttons", "cancel"))
+        self.cancel_btn = QPushButton(_t("buttons", "cancel"))
         self.cancel_btn.clicked.connect(self.cancel_process)
         self.cancel_btn.setEnabled(False)
         btn_layout.addWidget(self.process_btn)
@@ -361,7 +902,11 @@ class MinerUGUI(QMainWindow):
         # Right panel for markdown preview (hidden initially)
         self.preview_panel = QPlainTextEdit()
         self.preview_panel.setReadOnly(True)
+        # Chunked appends would otherwise record every slice for undo
+        self.preview_panel.setUndoRedoEnabled(False)
         self.preview_panel.hide()  # Hidden by default
+        self.preview_loader = None
+        self._preview_source = None
 
         # Add panels to main layout
         main_layout.addWidget(left_panel)
@@ -373,16 +918,30 @@ class MinerUGUI(QMainWindow):
         self.setCentralWidget(central_widget)
 
     def select_pdf(self):
-        path, _ = QFileDialog.getOpenFileName(
+        paths, _ = QFileDialog.getOpenFileNames(
             self,
             self.tm.get_text("dialogs", "select_pdf"),
             "",
             self.tm.get_text("dialogs", "pdf_filter"),
         )
-        if path:
-            self.input_path.setText(path)
+        if paths:
+            self.input_path.setText(PDF_PATH_SEPARATOR.join(paths))
             self._reset_output()
 
+    def _update_pdf_inputs(self, text):
+        # (path, name) for every PDF listed in the input field; a single
+        # existing file is taken as is, even if its path contains ";"
+        path = text.strip()
+        if os.path.isfile(path):
+            paths = [path]
+        else:
+            paths = [p for p in (p.strip() for p in text.split(";")) if p]
+        self._pdf_inputs = [(path, Path(path).stem) for path in paths]
+        # Load the models' code once there is something to convert rather
+        # than competing with the window for the first seconds after launch
+        if paths:
+            _prewarm_pipeline()
+
     def select_output(self):
         path = QFileDialog.getExistingDirectory(
             self, self.tm.get_text("dialogs", "select_output_dir")
@@ -391,13 +950,14 @@ class MinerUGUI(QMainWindow):
             self.output_path.setText(path)
 
     def _reset_output(self):
+        self._preview_source = None
         self.output_log.clear()
         self.preview_panel.setPlainText("")
         self.preview_panel.hide()
         self.status_label.setText(self.tm.get_text("status", "ready"))
 
     def process_pdf(self):
-        if not self.input_path.text() or not self.output_path.text():
+        if not self._pdf_inputs or not self.output_path.text():
             QMessageBox.warning(
                 self,
                 self.tm.get_text("messages", "error"),
@@ -405,32 +965,117 @@ class MinerUGUI(QMainWindow):
             )
             return
 
-        pdf_name = os.path.splitext(os.path.basename(self.input_path.text()))[0]
-        output_dir = self.output_path.text()
-        md_dir = os.path.join(output_dir, pdf_name)
+        # Output directories are named after the PDF, so names must be unique
+        # (compared case-insensitively for Windows and macOS file systems)
+        seen = set()
+        for _, pdf_name in self._pdf_inputs:
+            if pdf_name.casefold() in seen:
+                QMessageBox.warning(
+                    self,
+                    self.tm.get_text("messages", "error"),
+                    self.tm.get_text("messages", "duplicate_names", name=pdf_name),
+                )
+                return
+            seen.add(pdf_name.casefold())
 
-        if self._is_directory_non_empty(md_dir):
-            if not self._confirm_overwrite(md_dir):
+        output_dir = self.output_path.text()
+        existing_dirs = [
+            md_dir
+            for md_dir in (
+                os.path.join(output_dir, pdf_name) for _, pdf_name in self._pdf_inputs
+            )
+            if self._is_directory_non_empty(md_dir)
+        ]
+        if existing_dirs:
+            if not self._confirm_overwrite("\n".join(existing_dirs)):
                 return
 
-        pdf_path = self.input_path.text()
         method = self.method_combo.currentText()
         lang = self.lang_input.text().strip()
         start_page = self.start_page.value()
         end_page = self.end_page.value()
         debug = self.debug_check.isChecked()
+        use_cache = self.cache_check.isChecked()
+
+        self._run_options = (
+            output_dir,
+            method,
+            lang,
+            start_page,
+            end_page,
+            debug,
+            use_cache,
+        )
+        self._pending = collections.deque(self._pdf_inputs)
+        self._batch_total = len(self._pending)
+        self._batch_done = 0
+        self._batch_error = None
+        self._last_md_content = None
 
         self._start_processing()
+        self._start_next_runners()
 
-        self.runner = CommandRunner(
-            pdf_path, output_dir, method, lang, start_page, end_page, debug
-        )
-        self.runner.progress.connect(self.update_progress)
-        self.runner.finished.connect(self.process_finished)
-        self.runner.start()
+    def _start_next_runners(self):
+        """Start queued PDFs until the concurrency limit is reached"""
+        while self._pending and len(self._runners) < self.concurrency_spin.value():
+            pdf_path, pdf_name = self._pending.popleft()
+            if self._batch_total > 1:
+                self.output_log.appendPlainText(
+                    self.tm.get_text(
+                        "process_messages",
+                        "processing_file",
+                        file=pdf_path,
+                        index=self._batch_total - len(self._pending),
+                        total=self._batch_total,
+                    )
+                )
+            runner = CommandRunner(pdf_path, *self._run_options)
+            runner.progress_pending.connect(
+                functools.partial(self._schedule_progress_flush, runner)
+            )
+            runner.finished.connect(functools.partial(self._runner_finished, runner))
+            runner.page_progress.connect(self._page_progress)
+            self._runners[runner] = pdf_name
+            runner.start()
+
+    def _runner_finished(self, runner, success, message, md_content):
+        # finished is emitted before run() returns; let its cleanup complete
+        runner.wait()
+        self._flush_progress(runner)
+        pdf_name = self._runners.pop(runner)
+        self._batch_done += 1
+        if success:
+            md_path = os.path.join(
+                runner.output_path, pdf_name, runner.method, pdf_name + ".md"
+            )
+            self._last_md_content = md_content
+            self.output_log.appendPlainText(
+                self.tm.get_text("messages", "successful_md_path", md_path=md_path)
+            )
+        else:
+            self._batch_error = message
+        if self._batch_total > 1:
+            self.progress_bar.setValue(self._batch_done)
+
+        if self._pending:
+            self._start_next_runners()
+        elif not self._runners:
+            self.process_finished(self._batch_error is None, self._batch_error or "")
+
+    def _page_progress(self, done, total):
+        # A batch shows documents done instead; until a page is done the bar
+        # stays busy, as a single model batch reports nothing before the end
+        if self._batch_total == 1 and total and done:
+            self.progress_bar.setMaximum(total)
+            self.progress_bar.setValue(done)
 
     def _is_directory_non_empty(self, directory):
-        return os.path.exists(directory) and bool(os.listdir(directory))
+        # Stop at the first entry instead of listing the whole directory
+        try:
+            with os.scandir(directory) as it:
+                return next(it, None) is not None
+        except (FileNotFoundError, NotADirectoryError):
+            return False
 
     def _confirm_overwrite(self, directory):
         reply = QMessageBox.question(
@@ -445,13 +1090,15 @@ class MinerUGUI(QMainWindow):
     def _start_processing(self):
         self.process_btn.setEnabled(False)
         self.cancel_btn.setEnabled(True)
-        self.progress_bar.setMaximum(0)
+        # Busy indicator for one PDF, documents done out of total for a batch
+        self.progress_bar.setMaximum(0 if self._batch_total == 1 else self._batch_total)
+        self.progress_bar.setValue(0)
         self.status_label.setText(self.tm.get_text("status", "processing"))
         self.output_log.clear()
         self.cancel_requested = False
 
     def cancel_process(self):
-        if hasattr(self, "runner") and self.runner.isRunning():
+        if self._runners:
             # Confirmation to cancel and stop the program
             confirm_reply = QMessageBox.question(
                 self,
@@ -464,76 +1111,146 @@ class MinerUGUI(QMainWindow):
             if confirm_reply != QMessageBox.StandardButton.Yes:
                 return  # User chose not to cancel
 
-            pdf_name = os.path.splitext(os.path.basename(self.input_path.text()))[0]
-            output_dir = self.output_path.text()
-            md_dir = os.path.join(output_dir, pdf_name)
+            self._pending.clear()
+            output_dir = self._run_options[0]
+            md_dirs = [
+                md_dir
+                for md_dir in (
+                    os.path.join(output_dir, pdf_name)
+                    for pdf_name in self._runners.values()
+                )
+                if os.path.exists(md_dir)
+            ]
 
-            if os.path.exists(md_dir):
+            if md_dirs:
                 reply = QMessageBox.question(
                     self,
                     self.tm.get_text("messages", "cancel_cleanup_title"),
-                    self.tm.get_text("messages", "cancel_cleanup_message", dir=md_dir),
+                    self.tm.get_text(
+                        "messages", "cancel_cleanup_message", dir="\n".join(md_dirs)
+                    ),
                     QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
                     QMessageBox.StandardButton.Yes,
                 )
                 if reply == QMessageBox.StandardButton.Yes:
-                    try:
-                        shutil.rmtree(md_dir)
-                        self.output_log.appendPlainText(
-                            self.tm.get_text("messages", "cleanup_dir", dir=md_dir)
-                        )
-                    except Exception as e:
-                        self.output_log.appendPlainText(
-                            self.tm.get_text(
-                                "messages", "cleanup_error", dir=md_dir, error=str(e)
-                            )
-                        )
+                    # Move the directories out of the way first so they are
+                    # gone at once, then remove them in the background
+                    self.cancel_btn.setEnabled(False)
+                    self._cleanup_dirs = md_dirs
+                    trash_dirs = [self._move_to_trash(md_dir) for md_dir in md_dirs]
+                    self.cleanup_runner = CleanupRunner(trash_dirs)
+                    self.cleanup_runner.finished.connect(self._cleanup_finished)
+                    self.cleanup_runner.start()
+                    return
+
+            self._finish_cancel()
+
+    def _move_to_trash(self, md_dir):
+        trash_dir = f"{md_dir}.__trash_{os.getpid()}"
+        try:
+            os.rename(md_dir, trash_dir)
+        except OSError:
+            return md_dir  # e.g. files still open on Windows; delete in place
+        return trash_dir
 
+    def _cleanup_finished(self, success, error):
+        md_dirs = self._cleanup_dirs
+        if success:
+            for md_dir in md_dirs:
+                self.output_log.appendPlainText(
+                    self.tm.get_text("messages", "cleanup_dir", dir=md_dir)
+                )
+        else:
             self.output_log.appendPlainText(
-                self.tm.get_text("process_messages", "user_cancelled")
+                self.tm.get_text(
+                    "messages", "cleanup_error", dir=", ".join(md_dirs), error=error
+                )
             )
-            self.close()
+        self._finish_cancel()
+
+    def _finish_cancel(self):
+        self.output_log.appendPlainText(
+            self.tm.get_text("process_messages", "user_cancelled")
+        )
+        self.close()
+
+    def _schedule_progress_flush(self, runner):
+        QTimer.singleShot(
+            PROGRESS_BATCH_INTERVAL_MS,
+            functools.partial(self._flush_progress, runner),
+        )
+
+    def _flush_progress(self, runner):
+        message = runner.take_progress()
+        if message:
+            self.update_progress(message)
 
     def update_progress(self, message):
         self.output_log.appendPlainText(message)
 
     def process_finished(self, success, message):
-        self.progress_bar.setMaximum(100)
+        # Leave the bar full on success whatever it counted (pages, documents)
+        if self.progress_bar.maximum() == 0:
+            self.progress_bar.setMaximum(100)
+        if success:
+            self.progress_bar.setValue(self.progress_bar.maximum())
+        else:
+            self.progress_bar.reset()
         self.process_btn.setEnabled(True)
         self.cancel_btn.setEnabled(False)
 
         if success:
             self.status_label.setText(self.tm.get_text("status", "success"))
-            pdf_name = os.path.splitext(os.path.basename(self.input_path.text()))[0]
-            md_path = os.path.join(
-                self.output_path.text(),
-                pdf_name,
-                self.method_combo.currentText(),
-                pdf_name + ".md",
-            )
-            self.output_log.appendPlainText(
-                self.tm.get_text("messages", "successful_md_path", md_path=md_path)
-            )
-            # Show markdown preview after successful conversion
-            try:
-                if os.path.exists(md_path):
-                    with open(md_path, "r", encoding="utf-8") as f:
-                        markdown_content = f.read()
-                        self.preview_panel.setPlainText(markdown_content)
-                        self.preview_panel.show()  # Show the preview panel
-            except Exception as e:
-                self.output_log.appendPlainText(
-                    self.tm.get_text("messages", "preview_error", error=str(e))
-                )
         else:
             self.status_label.setText("Error: " + message)
 
+        # Show markdown preview of the last successful conversion
+        md_content = self._last_md_content
+        self._last_md_content = None
+        if md_content is not None:
+            self.preview_panel.clear()
+            self.preview_panel.show()  # Show the preview panel
+            loader = MarkdownLoader(md_content)
+            loader.chunk.connect(functools.partial(self._append_preview_chunk, loader))
+            loader.loaded.connect(functools.partial(self._preview_loaded, loader))
+            loader.failed.connect(self._preview_failed)
+            self.preview_loader = self._preview_source = loader
+            loader.start()
+
+    def _append_preview_chunk(self, loader, text):
+        if loader is not self._preview_source:
+            return  # Output was reset while the preview was loading
+        # Insert through a separate cursor so the view stays where it is
+        cursor = QTextCursor(self.preview_panel.document())
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        cursor.insertText(text)
+
+    def _preview_loaded(self, loader, truncated):
+        if loader is self._preview_source and truncated:
+            self._append_preview_chunk(
+                loader,
+                "\n\n"
+                + self.tm.get_text(
+                    "messages",
+                    "preview_truncated",
+                    count=f"{PREVIEW_MAX_CHARS:,}",
+                ),
+            )
+
+    def _preview_failed(self, error):
+        self.output_log.appendPlainText(
+            self.tm.get_text("messages", "preview_error", error=error)
+        )
+
 
 def main():
     app = QApplication(sys.argv)
     window = MinerUGUI()
     window.show()
-    sys.exit(app.exec())
+    status = app.exec()
+    if _prewarm_thread is not None:
+        _prewarm_thread.join()
+    return status
 
 
 if __name__ == "__main__":